@@ -1,24 +1,91 @@
 #!/usr/bin/env python3
 import os
 import sys
-import configparser
+import time
+import json
+import functools
 import subprocess
 import re
 import math
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+# Optional: used to invalidate device caches on hotplug
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
 # Configuration paths
 LOCAL_CONFIG = os.path.join(os.getcwd(), '.radio.conf')
 HOME_CONFIG = os.path.expanduser('~/.radio.conf')
 CONFIG_PATH = LOCAL_CONFIG if os.path.exists(LOCAL_CONFIG) else HOME_CONFIG
 
+# Minimal INI reader/writer for the app's fixed two-section schema;
+# configparser's interpolation and section-proxy machinery is overhead
+# we don't need
+def load_ini(path):
+    sections = {}
+    sec = None
+    try:
+        # One read(2) of the whole file; decode once rather than
+        # per-line through a text-mode wrapper
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return sections
+    for ln in data.decode('utf-8', 'replace').splitlines():
+        ln = ln.strip()
+        if not ln or ln[0] in '#;':
+            continue
+        if ln[0] == '[' and ln[-1] == ']':
+            sec = sections.setdefault(ln[1:-1], {})
+            continue
+        key, eq, val = ln.partition('=')
+        if sec is not None and eq:
+            sec[key.strip()] = val.strip()
+    return sections
+
+def dump_ini(sections):
+    return '\n'.join(
+        '[{}]\n{}\n'.format(name, '\n'.join(f'{k} = {v}' for k, v in kv.items()))
+        for name, kv in sections.items())
+
 # Load settings
-cfg = configparser.ConfigParser()
-cfg.read(CONFIG_PATH)
-rig_cfg = cfg['rigctld'] if cfg.has_section('rigctld') else {}
-audio_cfg = cfg['audio'] if cfg.has_section('audio') else {}
+cfg = load_ini(CONFIG_PATH)
+try:
+    _cfg_mtime = os.stat(CONFIG_PATH).st_mtime_ns
+except OSError:
+    _cfg_mtime = None
+
+# Reparse only when the file actually changed on disk
+def _reload_cfg_if_changed():
+    global _cfg_mtime
+    try:
+        m = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return
+    if m != _cfg_mtime:
+        cfg.clear()
+        cfg.update(load_ini(CONFIG_PATH))
+        _cfg_mtime = m
+# Plain dicts: per-key access skips configparser's interpolation and
+# section-proxy machinery
+rig_cfg = dict(cfg.get('rigctld', {}))
+audio_cfg = dict(cfg.get('audio', {}))
+
+# Refresh the dicts after cfg has been (re)loaded or modified; the
+# cached service commands are derived from them, so drop those too
+def _sync_cfg_dicts():
+    rig_cfg.clear()
+    rig_cfg.update(cfg.get('rigctld', {}))
+    audio_cfg.clear()
+    audio_cfg.update(cfg.get('audio', {}))
+    build_service_commands.cache_clear()
+
+ARDOP_LOG_DIR = os.path.expanduser('~/ardop_logs')
 
-# Build service commands
+# Build service commands; cached until save_config invalidates it
+@functools.lru_cache(maxsize=1)
 def build_service_commands():
     model = rig_cfg.get('model', '2050')
     device = rig_cfg.get('device', '/dev/ttyUSB0')
@@ -28,19 +95,79 @@ def build_service_commands():
     hw = audio_cfg.get('hw', '0,0')
     return [
         ['rigctld', '-m', model, '-r', device, '-s', baud, '-P', ptt, '-D', dcd],
-        ['./ardopcf', '--logdir', os.path.expanduser('~/ardop_logs'), '-p', device, '8515', f'plughw:{hw}', f'plughw:{hw}'],
+        ['./ardopcf', '--logdir', ARDOP_LOG_DIR, '-p', device, '8515', f'plughw:{hw}', f'plughw:{hw}'],
         ['pat', '--listen=ardop,telnet', 'http']
     ]
 
+# Write settings back to disk atomically; debounced so rapid saves from
+# the Configure tab coalesce into one rewrite
+_cfg_dirty = False
+
+def _flush_config():
+    global _cfg_dirty, _cfg_mtime
+    if not _cfg_dirty:
+        return
+    _cfg_dirty = False
+    tmp = CONFIG_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        f.write(dump_ini(cfg))
+    os.replace(tmp, CONFIG_PATH)
+    # Record our own write so the next reload check doesn't reparse
+    try:
+        _cfg_mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        pass
+
+def schedule_config_flush():
+    global _cfg_dirty
+    if not _cfg_dirty:
+        _cfg_dirty = True
+        QtCore.QTimer.singleShot(500, _flush_config)
+
+# Memoize a zero-argument loader with a time-to-live so rebuilding the
+# Configure tab doesn't re-run device enumeration every time
+def _cached(ttl):
+    def wrap(fn):
+        state = {'stamp': None, 'value': None}
+        def wrapper():
+            now = time.monotonic()
+            if state['stamp'] is None or now - state['stamp'] > ttl:
+                state['value'] = fn()
+                state['stamp'] = now
+            return state['value']
+        wrapper.cache_clear = lambda: state.update(stamp=None)
+        return wrapper
+    return wrap
+
+_SERIAL_PREFIXES = ('ttyUSB', 'ttyACM', 'ttyS')
+
 # List serial devices including GPS ports
+@_cached(ttl=30)
 def list_serial_devices():
     try:
-        return sorted(f"/dev/{d}" for d in os.listdir('/dev') if d.startswith(('ttyUSB', 'ttyACM', 'ttyS')))
+        with os.scandir('/dev') as it:
+            return sorted(f"/dev/{e.name}" for e in it if e.name.startswith(_SERIAL_PREFIXES))
     except FileNotFoundError:
         return []
 
+# The rig table only changes when hamlib is upgraded, so the parsed
+# list is kept on disk keyed on the rigctl version string
+_RIGS_CACHE = os.path.expanduser('~/.cache/radio_gui/rigs.json')
+
 # List available rigs via rigctl
+@_cached(ttl=3600)
 def list_rigs():
+    try:
+        version = subprocess.run(['rigctl', '--version'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        version = ''
+    try:
+        with open(_RIGS_CACHE) as f:
+            cached = json.load(f)
+        if version and cached.get('version') == version:
+            return [tuple(r) for r in cached['rigs']]
+    except (OSError, ValueError):
+        pass
     rigs = []
     try:
         out = subprocess.run(['rigctl', '-l'], capture_output=True, text=True, check=True).stdout
@@ -50,36 +177,132 @@ def list_rigs():
                 rigs.append((parts[0], parts[1], parts[2]))
     except subprocess.CalledProcessError:
         pass
+    if version and rigs:
+        try:
+            os.makedirs(os.path.dirname(_RIGS_CACHE), exist_ok=True)
+            tmp = _RIGS_CACHE + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump({'version': version, 'rigs': rigs}, f)
+            os.replace(tmp, _RIGS_CACHE)
+        except OSError:
+            pass
     return rigs
 
+# Drop the device caches when the kernel reports tty/sound hotplug, so
+# the TTLs only matter on systems without pyudev
+def _invalidate_device_caches(device=None):
+    list_serial_devices.cache_clear()
+    list_audio_pairs.cache_clear()
+
+def start_udev_monitor():
+    if pyudev is None:
+        return None
+    monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+    monitor.filter_by('tty')
+    monitor.filter_by('sound')
+    observer = pyudev.MonitorObserver(monitor, callback=_invalidate_device_caches)
+    observer.start()
+    return observer
+
+# Rig combo contents: option strings plus a model-id -> row lookup,
+# derived from list_rigs once per cache fill
+@_cached(ttl=3600)
+def rig_options():
+    rigs = list_rigs()
+    opts = [f"{n} - {m} {d}" for n, m, d in rigs]
+    index = {n: i for i, (n, _, _) in enumerate(rigs)}
+    return opts, index
+
+# Matches "Card N ... hw:X,Y" within a single line of ardopcf -m output
+_AUDIO_RE = re.compile(rb"Card\s+(\d+)[^\n]*?hw:(\d+,\d+)")
+
 # List audio pairs via ardopcf
+@_cached(ttl=30)
 def list_audio_pairs():
-    pairs = []
     try:
-        out = subprocess.run(['./ardopcf', '-m'], capture_output=True, text=True, check=True).stdout
-        for c, hw in re.findall(r"Card\s+(\d+).*?hw:(\d+,\d+)", out, re.DOTALL):
-            if (c, hw) not in pairs:
-                pairs.append((c, hw))
+        out = subprocess.run(['./ardopcf', '-m'], capture_output=True, check=True).stdout
     except subprocess.CalledProcessError:
-        pass
-    return pairs
+        return []
+    return [(c.decode('ascii'), hw.decode('ascii'))
+            for c, hw in dict.fromkeys(_AUDIO_RE.findall(out))]
+
+# NMEA field extractors, matched against raw bytes so uninteresting
+# sentences are rejected without decoding or splitting
+_RMC_RE = re.compile(rb'^\$GPRMC,([^,]*),A,(?:[^,]*,){6}([^,]*),')
+_GGA_RE = re.compile(rb'^\$GPGGA,[^,]*,([^,]*),([NS]),([^,]*),([EW]),([1-9]),([^,]*),[^,]*,([^,]*),')
+
+# Maidenhead alphabet tables: fields A-R, subsquares a-x
+_FIELD = 'ABCDEFGHIJKLMNOPQR'
+_SUB = 'abcdefghijklmnopqrstuvwx'
 
 # Convert lat/lon to Maidenhead grid locator
+@functools.lru_cache(maxsize=256)
 def latlon_to_grid(lat, lon):
-    lon += 180.0
-    lat += 90.0
-    A = ord('A')
-    lon_field = int(lon // 20)
-    lat_field = int(lat // 10)
-    lon_square = int((lon % 20) // 2)
-    lat_square = int((lat % 10) // 1)
-    lon_rem = lon - lon_field * 20 - lon_square * 2
-    lat_rem = lat - lat_field * 10 - lat_square * 1
-    lon_sub = int(lon_rem * 12)
-    lat_sub = int(lat_rem * 24)
-    return (f"{chr(A + lon_field)}{chr(A + lat_field)}"
-            f"{lon_square}{lat_square}"
-            f"{chr(A + lon_sub).lower()}{chr(A + lat_sub).lower()}")
+    # Scale by 240 (the finest subdivision: a subsquare is 20 lon units
+    # or 10 lat units) so every extraction is integer divmod; clamp so
+    # lat 90 / lon 180 fold into the top field instead of overrunning it
+    lon_i = min(int((lon + 180.0) * 240), 20 * 240 * 18 - 1)
+    lat_i = min(int((lat + 90.0) * 240), 10 * 240 * 18 - 1)
+    lon_field, r = divmod(lon_i, 20 * 240)
+    lon_square, r = divmod(r, 2 * 240)
+    lon_sub = r // 20
+    lat_field, r = divmod(lat_i, 10 * 240)
+    lat_square, r = divmod(r, 240)
+    lat_sub = r // 10
+    return ''.join((_FIELD[lon_field], _FIELD[lat_field],
+                    str(lon_square), str(lat_square),
+                    _SUB[lon_sub], _SUB[lat_sub]))
+
+# Runs one cached enumeration off the GUI thread so the Configure tab
+# finds warm caches when it is first opened; errors are left for the
+# on-demand call to surface
+class _CacheWarmer(QtCore.QRunnable):
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+
+    def run(self):
+        try:
+            self.fn()
+        except Exception:
+            pass
+
+# Icons are decoded from disk once and shared across widgets
+@functools.lru_cache(maxsize=None)
+def _icon(name):
+    return QtGui.QIcon(os.path.join('icons', name))
+
+# Shared gpspipe reader: one subprocess fans out complete NMEA lines to
+# every subscriber, so tab rebuilds never stack up a second gpspipe
+class GpsFeed(QtCore.QObject):
+    nmeaLine = QtCore.pyqtSignal(bytes)
+    rawChunk = QtCore.pyqtSignal(bytes)
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._buf = bytearray()
+        self.proc = QtCore.QProcess(self)
+        self.proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self.proc.readyReadStandardOutput.connect(self._read)
+        self.proc.start('gpspipe', ['-r'])
+
+    def _read(self):
+        # Complete lines are emitted; a partial trailing line stays in
+        # the buffer so a sentence split across chunks is never dropped
+        chunk = bytes(self.proc.readAllStandardOutput())
+        self.rawChunk.emit(chunk)
+        self._buf.extend(chunk)
+        while (nl := self._buf.find(b'\n')) != -1:
+            line = bytes(self._buf[:nl])
+            del self._buf[:nl + 1]
+            self.nmeaLine.emit(line)
 
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
@@ -91,6 +314,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.gps_override = False
         self.rmc_time = None
         self.rmc_date = None
+        self._last_pos = None
+        self._last_time = ''
+        self._last_date = ''
 
         # Status bar
         self.setStatusBar(QtWidgets.QStatusBar())
@@ -132,28 +358,33 @@ class MainWindow(QtWidgets.QMainWindow):
         self.sys_timer.start(1000)
         self.system_time()
 
+        # Fall back to system time when GPS fixes stop arriving
+        self.gps_watchdog = QtCore.QTimer(self)
+        self.gps_watchdog.setSingleShot(True)
+        self.gps_watchdog.setInterval(10000)
+        self.gps_watchdog.timeout.connect(self.gps_lost)
+
         # Tab widget
         self.tabs = QtWidgets.QTabWidget()
         self.tabs.setTabPosition(QtWidgets.QTabWidget.West)
         self.tabs.setIconSize(QtCore.QSize(64, 64))
         mainLayout.addWidget(self.tabs)
-        icoDir = 'icons'
-        icoPat = QtGui.QIcon(os.path.join(icoDir, 'pat-logo.png'))
-        icoGps = QtGui.QIcon(os.path.join(icoDir, 'gps.png'))
-        icoCfg = QtGui.QIcon(os.path.join(icoDir, 'configure.png'))
+        icoPat = _icon('pat-logo.png')
+        icoGps = _icon('gps.png')
+        icoCfg = _icon('configure.png')
 
         # --- Pat Tab ---
         wPat = QtWidgets.QWidget()
         self.tabs.addTab(wPat, icoPat, 'Pat')
         lp = QtWidgets.QVBoxLayout(wPat)
         bh = QtWidgets.QHBoxLayout()
-        pwr = QtGui.QIcon(os.path.join(icoDir, 'power.png'))
+        pwr = _icon('power.png')
         self.btnToggle = QtWidgets.QPushButton()
         self.btnToggle.setIcon(pwr)
         self.btnToggle.setIconSize(QtCore.QSize(64, 64))
         self.btnToggle.clicked.connect(self.toggle_services)
         bh.addWidget(self.btnToggle)
-        ff = QtGui.QIcon(os.path.join(icoDir, 'firefox.png'))
+        ff = _icon('firefox.png')
         self.btnBrowser = QtWidgets.QPushButton()
         self.btnBrowser.setIcon(ff)
         self.btnBrowser.setIconSize(QtCore.QSize(64, 64))
@@ -163,12 +394,49 @@ class MainWindow(QtWidgets.QMainWindow):
         lp.addLayout(bh)
         self.output_console = QtWidgets.QPlainTextEdit(readOnly=True)
         self.output_console.setStyleSheet('background:black;color:lightgreen')
+        self.output_console.setMaximumBlockCount(2000)
+        self.output_console.document().setUndoRedoEnabled(False)
+        self.output_console.setCenterOnScroll(True)
         lp.addWidget(self.output_console)
+        # Child output is polled and coalesced once per flush interval
+        self._console_timer = QtCore.QTimer(self)
+        self._console_timer.timeout.connect(self.flush_console)
+        self._console_timer.setInterval(100)
 
-        # --- GPS Tab ---
+        # --- GPS / Configure Tabs ---
+        # Built lazily on first activation so startup doesn't pay for
+        # rig/audio/serial enumeration up front
+        self._tab_builders = {}
         wGps = QtWidgets.QWidget()
-        self.tabs.addTab(wGps, icoGps, 'GPS')
-        form = QtWidgets.QFormLayout(wGps)
+        self._tab_builders[self.tabs.addTab(wGps, icoGps, 'GPS')] = (wGps, self.build_gps_ui)
+        wCfg = QtWidgets.QScrollArea()
+        wCfg.setWidgetResizable(True)
+        cont = QtWidgets.QWidget()
+        wCfg.setWidget(cont)
+        self._tab_builders[self.tabs.addTab(wCfg, icoCfg, 'Configure')] = (cont, self.build_config_ui)
+        self.tabs.currentChanged.connect(self.build_tab)
+
+        # Subscribe to the shared GPS feed so the header clock and grid
+        # track fixes even before the GPS tab is first opened
+        self._gps_ui_ready = False
+        feed = GpsFeed.instance()
+        feed.nmeaLine.connect(self.parse_gps_line)
+        feed.rawChunk.connect(self.append_raw_nmea)
+
+        # Kick the slow enumerations off on worker threads so they run
+        # concurrently while Qt paints the window
+        pool = QtCore.QThreadPool.globalInstance()
+        for fn in (rig_options, list_audio_pairs, list_serial_devices):
+            pool.start(_CacheWarmer(fn))
+
+    def build_tab(self, idx):
+        builder = self._tab_builders.pop(idx, None)
+        if builder:
+            parent, build = builder
+            build(parent)
+
+    def build_gps_ui(self, parent):
+        form = QtWidgets.QFormLayout(parent)
         self.gps_time = QtWidgets.QLabel('--')
         form.addRow('Time:', self.gps_time)
         self.gps_date = QtWidgets.QLabel('--')
@@ -187,74 +455,101 @@ class MainWindow(QtWidgets.QMainWindow):
         self.gps_raw = QtWidgets.QPlainTextEdit(readOnly=True)
         self.gps_raw.setStyleSheet('background:black;color:white')
         self.gps_raw.setFixedHeight(150)
+        self.gps_raw.setMaximumBlockCount(200)
+        self.gps_raw.document().setUndoRedoEnabled(False)
+        self.gps_raw.setCenterOnScroll(True)
         form.addRow('Raw NMEA:', self.gps_raw)
-        # Start gpspipe
-        self.gps_proc = QtCore.QProcess(self)
-        self.gps_proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
-        self.gps_proc.readyReadStandardOutput.connect(self.parse_gps)
-        self.gps_proc.start('gpspipe', ['-r'])
-
-        # --- Configure Tab ---
-        wCfg = QtWidgets.QScrollArea()
-        wCfg.setWidgetResizable(True)
-        cont = QtWidgets.QWidget()
-        wCfg.setWidget(cont)
-        self.tabs.addTab(wCfg, icoCfg, 'Configure')
-        self.build_config_ui(cont)
+        # Forget the last repainted position: gps_grid starts at '--'
+        # and a stationary station would otherwise never repaint it
+        self._last_pos = None
+        self._gps_ui_ready = True
 
     def system_time(self):
+        if self.gps_override:
+            return
         now = QtCore.QDateTime.currentDateTime()
-        if not self.gps_override:
-            self.lblTime.setText(now.toString('HH:mm:ss'))
-            self.lblDate.setText(now.toString('yyyy-MM-dd'))
-
-    def parse_gps(self):
-        raw = self.gps_proc.readAllStandardOutput().data().decode()
-        lines = raw.split('\n')
-        self.gps_raw.appendPlainText(raw.rstrip())
-        for line in lines:
-            if line.startswith('$GPRMC'):
-                parts = line.split(',')
-                if len(parts) > 9 and parts[2] == 'A':
-                    self.rmc_time, self.rmc_date = parts[1], parts[9]
-            elif line.startswith('$GPGGA') and self.rmc_time:
-                p2 = line.split(',')
-                if len(p2) > 9 and p2[6] != '0':
-                    lat, lat_h = p2[2], p2[3]
-                    lon, lon_h = p2[4], p2[5]
-                    sats, alt = p2[7], p2[9]
-                    t, d = self.rmc_time, self.rmc_date
-                    self.gps_time.setText(f"{t[:2]}:{t[2:4]}:{t[4:6]}")
-                    self.lblTime.setText(self.gps_time.text())
-                    self.gps_date.setText(f"{d[2:4]}/{d[4:6]}/{d[:2]}")
-                    self.lblDate.setText(self.gps_date.text())
-                    def fmt(v, h):
-                        deg_len = 2 if len(v.split('.')[0]) <= 4 else 3
-                        return f"{v[:deg_len]}° {v[deg_len:]} '{h}'"
-                    self.gps_lat.setText(fmt(lat, lat_h))
-                    self.gps_lon.setText(fmt(lon, lon_h))
-                    self.gps_sats.setText(sats)
-                    self.gps_alt.setText(f"{alt} m")
-                    # Convert to signed decimal degrees, accounting for N/S and E/W
-                    lat_dd = (float(lat[:2]) + float(lat[2:]) / 60) * (1 if lat_h == 'N' else -1)
-                    lon_dd = (float(lon[:3]) + float(lon[3:]) / 60) * (1 if lon_h == 'E' else -1)
-                    self.gps_grid.setText(latlon_to_grid(lat_dd, lon_dd))
-                    self.gps_override = True
-                break
+        t = now.toString('HH:mm:ss')
+        if t != self._last_time:
+            self._last_time = t
+            self.lblTime.setText(t)
+        d = now.toString('yyyy-MM-dd')
+        if d != self._last_date:
+            self._last_date = d
+            self.lblDate.setText(d)
+
+    def append_raw_nmea(self, chunk):
+        if self._gps_ui_ready and chunk:
+            # NMEA is ASCII; skip the UTF-8 decoder for the raw view
+            self.gps_raw.appendPlainText(chunk.decode('ascii', 'replace').rstrip())
+
+    def parse_gps_line(self, bline):
+        m = _RMC_RE.match(bline)
+        if m:
+            self.rmc_time = m.group(1).decode('ascii', 'replace')
+            self.rmc_date = m.group(2).decode('ascii', 'replace')
+            return
+        m = _GGA_RE.match(bline)
+        if m and self.rmc_time:
+            lat, lat_h, lon, lon_h, sats, alt = (
+                g.decode('ascii', 'replace') for g in m.group(1, 2, 3, 4, 6, 7))
+            t, d = self.rmc_time, self.rmc_date
+            self.lblTime.setText(f"{t[:2]}:{t[2:4]}:{t[4:6]}")
+            self.lblDate.setText(f"{d[2:4]}/{d[4:6]}/{d[:2]}")
+            if self._gps_ui_ready:
+                self.gps_time.setText(self.lblTime.text())
+                self.gps_date.setText(self.lblDate.text())
+                def fmt(v, h):
+                    deg_len = 2 if len(v.split('.')[0]) <= 4 else 3
+                    return f"{v[:deg_len]}° {v[deg_len:]} '{h}'"
+                self.gps_lat.setText(fmt(lat, lat_h))
+                self.gps_lon.setText(fmt(lon, lon_h))
+                self.gps_sats.setText(sats)
+                self.gps_alt.setText(f"{alt} m")
+            # Convert to signed decimal degrees, accounting for N/S and E/W
+            lat_dd = (float(lat[:2]) + float(lat[2:]) / 60) * (1 if lat_h == 'N' else -1)
+            lon_dd = (float(lon[:3]) + float(lon[3:]) / 60) * (1 if lon_h == 'E' else -1)
+            # Quantize to ~11 m (well below a subsquare) so a
+            # stationary fix skips the recompute and repaint
+            pos = (round(lat_dd, 4), round(lon_dd, 4))
+            if pos != self._last_pos:
+                self._last_pos = pos
+                grid = latlon_to_grid(*pos)
+                self.lblGrid.setText(f"My Grid: {grid}")
+                if self._gps_ui_ready:
+                    self.gps_grid.setText(grid)
+            if not self.gps_override:
+                # GPS owns the clock now; stop the per-second wakeup
+                self.gps_override = True
+                self.sys_timer.stop()
+            self.gps_watchdog.start()
+
+    def gps_lost(self):
+        self.gps_override = False
+        # GPS wrote its own formats into the labels; drop the caches so
+        # the next tick repaints both
+        self._last_time = ''
+        self._last_date = ''
+        self.sys_timer.start(1000)
+        self.system_time()
 
     def toggle_services(self):
         if not self.services_running:
             for cmd in build_service_commands():
                 p = QtCore.QProcess(self)
                 p.setProcessChannelMode(QtCore.QProcess.MergedChannels)
-                p.readyReadStandardOutput.connect(lambda pr=p: self.output_console.appendPlainText(pr.readAllStandardOutput().data().decode()))
                 p.start(cmd[0], cmd[1:])
                 self.processes.append(p)
+            self._console_timer.start()
             self.services_running = True
         else:
             for p in self.processes:
-                p.kill()
-            os.system('killall rigctld ardopcf pat')
+                p.terminate()
+            for p in self.processes:
+                if not p.waitForFinished(1500):
+                    p.kill()
+                    p.waitForFinished(500)
+            self._console_timer.stop()
+            self.flush_console()
             self.processes.clear()
             self.services_running = False
         self.update_status()
@@ -262,6 +557,11 @@ class MainWindow(QtWidgets.QMainWindow):
     def open_browser(self):
         QtGui.QDesktopServices.openUrl(QtCore.QUrl('http://localhost:8080'))
 
+    def flush_console(self):
+        data = b''.join(bytes(p.readAllStandardOutput()) for p in self.processes)
+        if data:
+            self.output_console.appendPlainText(data.decode(errors='replace').rstrip('\n'))
+
     def build_config_ui(self, parent):
         layout = QtWidgets.QVBoxLayout(parent)
         # My Info
@@ -276,13 +576,11 @@ class MainWindow(QtWidgets.QMainWindow):
         grp2 = QtWidgets.QGroupBox('CAT Control')
         layout.addWidget(grp2)
         g2L = QtWidgets.QFormLayout(grp2)
-        rigs = list_rigs()
-        opts = [f"{n} - {m} {d}" for n, m, d in rigs]
+        opts, rig_index = rig_options()
         self.cbRig = QtWidgets.QComboBox()
-        self.cbRig.addItems(opts)
+        self.cbRig.setModel(QtCore.QStringListModel(opts, self.cbRig))
         if rig_cfg.get('model'):
-            idx = next((i for i, v in enumerate(opts) if v.startswith(rig_cfg['model'])), 0)
-            self.cbRig.setCurrentIndex(idx)
+            self.cbRig.setCurrentIndex(rig_index.get(rig_cfg['model'], 0))
         g2L.addRow('Rig:', self.cbRig)
         devs = list_serial_devices()
         self.cbDev = QtWidgets.QComboBox()
@@ -340,6 +638,9 @@ class MainWindow(QtWidgets.QMainWindow):
         btns = QtWidgets.QHBoxLayout()
         layout.addLayout(btns)
         btns.addStretch()
+        btnRefresh = QtWidgets.QPushButton('Refresh')
+        btnRefresh.clicked.connect(self.refresh_devices)
+        btns.addWidget(btnRefresh)
         btnSave = QtWidgets.QPushButton('Save')
         btnSave.clicked.connect(self.save_config)
         btns.addWidget(btnSave)
@@ -347,6 +648,23 @@ class MainWindow(QtWidgets.QMainWindow):
         btnCancel.clicked.connect(self.cancel_config)
         btns.addWidget(btnCancel)
 
+    def refresh_devices(self):
+        for fn in (list_rigs, rig_options, list_serial_devices, list_audio_pairs):
+            fn.cache_clear()
+        cur = self.cbRig.currentText()
+        self.cbRig.setModel(QtCore.QStringListModel(rig_options()[0], self.cbRig))
+        self.cbRig.setCurrentText(cur)
+        devs = list_serial_devices()
+        for cb in (self.cbDev, self.cbGPS):
+            cur = cb.currentText()
+            cb.clear()
+            cb.addItems(devs)
+            cb.setCurrentText(cur)
+        cur = self.cbAudio.currentText()
+        self.cbAudio.clear()
+        self.cbAudio.addItems([f"Card {c} hw:{hw}" for c, hw in list_audio_pairs()])
+        self.cbAudio.setCurrentText(cur)
+
     def update_status(self):
         msg = 'Services running: rigctld, ardopcf, pat' if self.services_running else 'Services stopped'
         self.statusBar().showMessage(msg)
@@ -355,10 +673,8 @@ class MainWindow(QtWidgets.QMainWindow):
         QtGui.QDesktopServices.openUrl(QtCore.QUrl('http://localhost:8080'))
 
     def save_config(self):
-        if not cfg.has_section('rigctld'):
-            cfg.add_section('rigctld')
-        if not cfg.has_section('audio'):
-            cfg.add_section('audio')
+        cfg.setdefault('rigctld', {})
+        cfg.setdefault('audio', {})
         cfg['rigctld']['my_call'] = self.eCall.text()
         cfg['rigctld']['my_grid'] = self.eGrid.text()
         cfg['rigctld']['model'] = self.cbRig.currentText().split()[0]
@@ -378,15 +694,18 @@ class MainWindow(QtWidgets.QMainWindow):
         cfg['audio']['card'] = c
         cfg['audio']['hw'] = hw
         cfg['rigctld']['gps_device'] = self.cbGPS.currentText()
-        with open(CONFIG_PATH, 'w') as f:
-            cfg.write(f)
+        _sync_cfg_dicts()
+        # A save often follows replugging hardware; rescan /dev next time
+        list_serial_devices.cache_clear()
+        schedule_config_flush()
         self.lblCall.setText(f"My Call: {self.eCall.text()}")
         self.lblGrid.setText(f"My Grid: {self.eGrid.text()}")
 
     def cancel_config(self):
-        cfg.read(CONFIG_PATH)
-        self.eCall.setText(cfg['rigctld'].get('my_call', ''))
-        self.eGrid.setText(cfg['rigctld'].get('my_grid', ''))
+        _reload_cfg_if_changed()
+        _sync_cfg_dicts()
+        self.eCall.setText(rig_cfg.get('my_call', ''))
+        self.eGrid.setText(rig_cfg.get('my_grid', ''))
         self.cbRig.setCurrentText(rig_cfg.get('model', ''))
         self.cbDev.setCurrentText(rig_cfg.get('device', ''))
         self.cbBaud.setCurrentText(rig_cfg.get('baud', ''))
@@ -399,6 +718,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
 if __name__ == '__main__':
     app = QtWidgets.QApplication(sys.argv)
+    app.aboutToQuit.connect(_flush_config)
+    udev_observer = start_udev_monitor()
     pal = QtGui.QPalette()
     pal.setColor(QtGui.QPalette.Window, QtGui.QColor('black'))
     pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor('lightblue'))